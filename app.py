@@ -47,6 +47,8 @@ class User(db.Model):
 
 class Job(db.Model):
     __tablename__ = 'jobs'
+    # Never hand out a job_id twice on SQLite, so archived jobs keep a unique id
+    __table_args__ = {'sqlite_autoincrement': True}
     
     job_id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.user_id', ondelete='CASCADE'), nullable=False)
@@ -59,6 +61,28 @@ class Job(db.Model):
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
 
+# Old accepted/rejected jobs are moved here by archive_jobs.py so they stay out of the hot jobs table
+class ArchivedJob(db.Model):
+    __tablename__ = 'archived_jobs'
+    # Covers the per-user, per-status counts on the dashboard
+    __table_args__ = (db.Index('ix_archived_jobs_user_status', 'user_id', 'status'),)
+    
+    archive_id = db.Column(db.Integer, primary_key=True)
+    # The job_id the row had in the jobs table
+    original_job_id = db.Column(db.Integer, nullable=False, index=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.user_id', ondelete='CASCADE'), nullable=False)
+    title = db.Column(db.String(100), nullable=False)
+    company = db.Column(db.String(100), nullable=False)
+    status = db.Column(db.Enum('accepted', 'rejected'), nullable=False)
+    application_date = db.Column(db.Date)
+    deadline_date = db.Column(db.Date)
+    notes = db.Column(db.Text)
+    created_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime)
+    archived_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    
+    user = db.relationship('User', backref=db.backref('archived_jobs', lazy=True, cascade='all, delete-orphan'))
+
 # JWT error handlers
 @jwt.expired_token_loader
 def expired_token_callback(jwt_header, jwt_payload):
@@ -173,6 +197,7 @@ def get_jobs():
         status = request.args.get('status')
         search = request.args.get('search')
         limit = request.args.get('limit', type=int)
+        include_archived = request.args.get('include_archived', 'false').lower() in ('true', '1', 'yes')
         
         # Build query
         query = Job.query.filter_by(user_id=current_user_id)
@@ -205,9 +230,48 @@ def get_jobs():
             'deadline_date': job.deadline_date.isoformat() if job.deadline_date else None,
             'notes': job.notes,
             'created_at': job.created_at.isoformat(),
-            'updated_at': job.updated_at.isoformat()
+            'updated_at': job.updated_at.isoformat(),
+            'archived': False
         } for job in jobs]
         
+        # Only touch the archive table when the caller asks for it
+        if include_archived:
+            archive_query = ArchivedJob.query.filter_by(user_id=current_user_id)
+            
+            if status and status != 'all':
+                archive_query = archive_query.filter_by(status=status)
+            
+            if search:
+                search_term = f'%{search}%'
+                archive_query = archive_query.filter((ArchivedJob.title.like(search_term)) | (ArchivedJob.company.like(search_term)))
+            
+            archive_query = archive_query.order_by(ArchivedJob.application_date.desc())
+            
+            if limit:
+                archived_jobs = archive_query.limit(limit).all()
+            else:
+                archived_jobs = archive_query.all()
+            
+            print(f"Fetched {len(archived_jobs)} archived jobs for user {current_user_id}")
+            
+            jobs_data.extend({
+                'job_id': job.original_job_id,
+                'title': job.title,
+                'company': job.company,
+                'status': job.status,
+                'application_date': job.application_date.isoformat() if job.application_date else None,
+                'deadline_date': job.deadline_date.isoformat() if job.deadline_date else None,
+                'notes': job.notes,
+                'created_at': job.created_at.isoformat() if job.created_at else None,
+                'updated_at': job.updated_at.isoformat() if job.updated_at else None,
+                'archived': True
+            } for job in archived_jobs)
+            
+            # Merge both lists back into application date order (ISO dates sort as strings)
+            jobs_data.sort(key=lambda job: job['application_date'] or '', reverse=True)
+            if limit:
+                jobs_data = jobs_data[:limit]
+        
         return jsonify(success=True, jobs=jobs_data)
     except Exception as e:
         return jsonify(success=False, message=f"Error fetching jobs: {str(e)}"), 500
@@ -223,7 +287,28 @@ def get_job_by_id(job_id):
         job = Job.query.filter_by(job_id=job_id, user_id=current_user_id).first()
         
         if not job:
-            return jsonify(success=False, message="Job not found"), 404
+            # Fall back to the archive for jobs moved there by archive_jobs.py
+            archived_job = ArchivedJob.query.filter_by(
+                original_job_id=job_id, user_id=current_user_id
+            ).order_by(ArchivedJob.archived_at.desc()).first()
+            
+            if not archived_job:
+                return jsonify(success=False, message="Job not found"), 404
+            
+            job_data = {
+                'job_id': archived_job.original_job_id,
+                'title': archived_job.title,
+                'company': archived_job.company,
+                'status': archived_job.status,
+                'application_date': archived_job.application_date.isoformat() if archived_job.application_date else None,
+                'deadline_date': archived_job.deadline_date.isoformat() if archived_job.deadline_date else None,
+                'notes': archived_job.notes,
+                'created_at': archived_job.created_at.isoformat() if archived_job.created_at else None,
+                'updated_at': archived_job.updated_at.isoformat() if archived_job.updated_at else None,
+                'archived': True
+            }
+            
+            return jsonify(success=True, job=job_data)
         
         job_data = {
             'job_id': job.job_id,
@@ -234,7 +319,8 @@ def get_job_by_id(job_id):
             'deadline_date': job.deadline_date.isoformat() if job.deadline_date else None,
             'notes': job.notes,
             'created_at': job.created_at.isoformat(),
-            'updated_at': job.updated_at.isoformat()
+            'updated_at': job.updated_at.isoformat(),
+            'archived': False
         }
         
         return jsonify(success=True, job=job_data)
@@ -309,7 +395,8 @@ def create_job():
                 'deadline_date': parsed_deadline_date.isoformat() if parsed_deadline_date else None,
                 'notes': notes,
                 'created_at': new_job.created_at.isoformat(),
-                'updated_at': new_job.updated_at.isoformat()
+                'updated_at': new_job.updated_at.isoformat(),
+                'archived': False
             }
         ), 201
     except Exception as e:
@@ -330,6 +417,9 @@ def update_job(job_id):
         job = Job.query.filter_by(job_id=job_id, user_id=current_user_id).first()
         
         if not job:
+            # Archived jobs are read-only
+            if ArchivedJob.query.filter_by(original_job_id=job_id, user_id=current_user_id).first():
+                return jsonify(success=False, message="Archived jobs are read-only"), 409
             return jsonify(success=False, message="Job not found"), 404
         
         # Validate status if provided
@@ -373,7 +463,8 @@ def update_job(job_id):
                 'deadline_date': job.deadline_date.isoformat() if job.deadline_date else None,
                 'notes': job.notes,
                 'created_at': job.created_at.isoformat(),
-                'updated_at': job.updated_at.isoformat()
+                'updated_at': job.updated_at.isoformat(),
+                'archived': False
             }
         )
     except Exception as e:
@@ -390,6 +481,9 @@ def delete_job(job_id):
         job = Job.query.filter_by(job_id=job_id, user_id=current_user_id).first()
         
         if not job:
+            # Archived jobs are read-only
+            if ArchivedJob.query.filter_by(original_job_id=job_id, user_id=current_user_id).first():
+                return jsonify(success=False, message="Archived jobs are read-only"), 409
             return jsonify(success=False, message="Job not found"), 404
         
         db.session.delete(job)
@@ -511,6 +605,15 @@ def get_dashboard_stats():
         interview_count = Job.query.filter_by(user_id=current_user_id, status='interview').count()
         accepted_count = Job.query.filter_by(user_id=current_user_id, status='accepted').count()
         rejected_count = Job.query.filter_by(user_id=current_user_id, status='rejected').count()
+        
+        # Archived jobs still count towards the totals (index-only count on archived_jobs)
+        archived_counts = dict(db.session.query(
+            ArchivedJob.status, db.func.count(ArchivedJob.archive_id)
+        ).filter(ArchivedJob.user_id == current_user_id).group_by(ArchivedJob.status).all())
+        accepted_count += archived_counts.get('accepted', 0)
+        rejected_count += archived_counts.get('rejected', 0)
+        archived_count = sum(archived_counts.values())
+        
         total_count = bookmark_count + applied_count + interview_count + accepted_count + rejected_count
         
         # Get upcoming deadlines
@@ -585,6 +688,7 @@ def get_dashboard_stats():
                 'interview': interview_count,
                 'accepted': accepted_count,
                 'rejected': rejected_count,
+                'archived': archived_count,
                 'upcoming_deadlines': deadline_data,
                 'monthly_stats': monthly_data,
                 'recent_activity': activity_data
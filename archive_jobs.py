@@ -0,0 +1,85 @@
+from app import app, db, Job, ArchivedJob
+from datetime import datetime, timedelta, timezone
+import os
+import sys
+import time
+
+# Archival settings (override in .env)
+ARCHIVE_AFTER_DAYS = int(os.environ.get('ARCHIVE_AFTER_DAYS', 365))
+ARCHIVE_BATCH_SIZE = int(os.environ.get('ARCHIVE_BATCH_SIZE', 500))
+ARCHIVE_BATCH_DELAY = float(os.environ.get('ARCHIVE_BATCH_DELAY', 0.5))
+
+# Only jobs in a final status are ever archived
+TERMINAL_STATUSES = ['accepted', 'rejected']
+
+def archive_batch(cutoff, last_id):
+    # Pick the next batch of old accepted/rejected jobs, continuing after the last
+    # job_id seen so each batch is a primary key range scan, not a rescan from the start
+    jobs = Job.query.filter(
+        Job.job_id > last_id,
+        Job.status.in_(TERMINAL_STATUSES),
+        Job.updated_at < cutoff
+    ).order_by(Job.job_id).limit(ARCHIVE_BATCH_SIZE).all()
+    
+    if not jobs:
+        return 0, 0, last_id
+    
+    selected = len(jobs)
+    last_id = jobs[-1].job_id
+    
+    # Move each job in one short transaction. The DELETE repeats the status and age
+    # checks, so a job edited since it was selected stays in jobs and is not archived.
+    archived = 0
+    for job in jobs:
+        deleted = Job.query.filter(
+            Job.job_id == job.job_id,
+            Job.status.in_(TERMINAL_STATUSES),
+            Job.updated_at < cutoff
+        ).delete(synchronize_session=False)
+        if not deleted:
+            continue
+        
+        db.session.add(ArchivedJob(
+            original_job_id=job.job_id,
+            user_id=job.user_id,
+            title=job.title,
+            company=job.company,
+            status=job.status,
+            application_date=job.application_date,
+            deadline_date=job.deadline_date,
+            notes=job.notes,
+            created_at=job.created_at,
+            updated_at=job.updated_at
+        ))
+        archived += 1
+    
+    db.session.commit()
+    
+    return selected, archived, last_id
+
+with app.app_context():
+    try:
+        db.create_all()
+        
+        # Stored timestamps are naive UTC, so compare against a naive cutoff
+        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=ARCHIVE_AFTER_DAYS)
+        print(f"Archiving accepted/rejected jobs last updated before {cutoff.isoformat()}")
+        
+        total_archived = 0
+        last_id = 0
+        while True:
+            selected, archived, last_id = archive_batch(cutoff, last_id)
+            if not selected:
+                break
+            
+            total_archived += archived
+            print(f"Archived {archived} of {selected} jobs ({total_archived} total)")
+            
+            # Pause between batches so normal traffic can get at the jobs table
+            time.sleep(ARCHIVE_BATCH_DELAY)
+        
+        print(f"Archiving finished: {total_archived} jobs moved to archived_jobs")
+    except Exception as e:
+        db.session.rollback()
+        print(f"Archiving error: {e}")
+        sys.exit(1)
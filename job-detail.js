@@ -106,6 +106,12 @@ document.addEventListener("DOMContentLoaded", () => {
         statusBadge.textContent = capitalizeFirstLetter(job.status);
         statusBadge.className = `status-badge status-${job.status}`;
         
+        // Archived jobs are read-only
+        if (job.archived) {
+            document.getElementById('edit-btn').style.display = 'none';
+            document.getElementById('delete-btn').style.display = 'none';
+        }
+        
         // Set values in edit mode
         document.getElementById('job-title-input').value = job.title;
         document.getElementById('job-company-input').value = job.company;